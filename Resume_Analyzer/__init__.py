@@ -0,0 +1 @@
+"""Resume Analyzer package: PDF extraction, parsing, ATS scoring, and AI insights"""
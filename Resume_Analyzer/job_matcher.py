@@ -6,8 +6,7 @@ Provides detailed job compatibility analysis and career recommendations
 import logging
 from config import ATS_KEYWORDS, INDUSTRY_INSIGHTS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; logging is configured once by the app entrypoint
 logger = logging.getLogger(__name__)
 
 class JobRoleMatcher:
@@ -17,22 +16,25 @@ class JobRoleMatcher:
         self.ats_keywords = ATS_KEYWORDS
         self.industry_insights = INDUSTRY_INSIGHTS
     
-    def get_comprehensive_job_analysis(self, text, sections, target_role=None):
+    def get_comprehensive_job_analysis(self, text, sections, target_role=None, features=None):
         """
         Generate detailed job role compatibility analysis with specific reasoning
-        
+
         Args:
             text (str): Resume text content
             sections (dict): Parsed resume sections
             target_role (str): Optional target role for focused analysis
-            
+            features (dict): Optional precomputed features from
+                ResumeParser.precompute_features; skips re-scanning the text
+
         Returns:
             dict: Comprehensive job analysis with recommendations
         """
-        text_lower = text.lower()
-        
+        text_lower = features['lower'] if features else text.lower()
+
         # Calculate compatibility scores for all roles
-        role_compatibility = self._calculate_role_compatibility(text_lower)
+        keyword_hits = features['keyword_hits'] if features else None
+        role_compatibility = self._calculate_role_compatibility(text_lower, keyword_hits)
         
         # Generate detailed role suggestions
         detailed_suggestions = self._generate_detailed_role_suggestions(
@@ -55,31 +57,40 @@ class JobRoleMatcher:
         logger.info(f"Generated comprehensive job analysis with {len(detailed_suggestions)} role suggestions")
         return analysis_result
     
-    def _calculate_role_compatibility(self, text_lower):
+    def _calculate_role_compatibility(self, text_lower, keyword_hits=None):
         """Calculate compatibility scores for each role"""
         role_compatibility = {}
-        
+
         for role_key, role_data in self.ats_keywords.items():
             # Collect all relevant keywords for the role
             core_skills = role_data.get('core_skills', [])
             frameworks = role_data.get('frameworks', [])
             methodologies = role_data.get('methodologies', [])
             platforms = role_data.get('platforms', [])
-            
-            all_keywords = core_skills + frameworks + methodologies + platforms
-            
-            # Calculate matches with weighted scoring
-            matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
-            matched_frameworks = [fw for fw in frameworks if fw.lower() in text_lower]
-            matched_methodologies = [method for method in methodologies if method.lower() in text_lower]
-            matched_platforms = [platform for platform in platforms if platform.lower() in text_lower]
-            
+
+            # Calculate matches with weighted scoring; precomputed hits skip
+            # re-scanning the text per role
+            hits = keyword_hits.get(role_key) if keyword_hits else None
+            if hits is not None:
+                matched_core = hits['core_skills']
+                matched_frameworks = hits['frameworks']
+                matched_methodologies = hits['methodologies']
+                matched_platforms = hits['platforms']
+            else:
+                matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
+                matched_frameworks = [fw for fw in frameworks if fw.lower() in text_lower]
+                matched_methodologies = [method for method in methodologies if method.lower() in text_lower]
+                matched_platforms = [platform for platform in platforms if platform.lower() in text_lower]
+
             # Weighted scoring (core skills are most important)
             core_score = len(matched_core) * 3
             framework_score = len(matched_frameworks) * 2
             methodology_score = len(matched_methodologies) * 1.5
             platform_score = len(matched_platforms) * 1
             
+            matched_core_set = set(matched_core)
+            matched_framework_set = set(matched_frameworks)
+
             total_score = core_score + framework_score + methodology_score + platform_score
             max_possible_score = len(core_skills) * 3 + len(frameworks) * 2 + len(methodologies) * 1.5 + len(platforms) * 1
             
@@ -91,8 +102,8 @@ class JobRoleMatcher:
                 'matched_frameworks': matched_frameworks,
                 'matched_methodologies': matched_methodologies,
                 'matched_platforms': matched_platforms,
-                'missing_core_skills': [skill for skill in core_skills if skill.lower() not in text_lower],
-                'missing_frameworks': [fw for fw in frameworks if fw.lower() not in text_lower],
+                'missing_core_skills': [skill for skill in core_skills if skill not in matched_core_set],
+                'missing_frameworks': [fw for fw in frameworks if fw not in matched_framework_set],
                 'role_data': role_data
             }
         
@@ -6,10 +6,9 @@ Handles detailed resume section analysis and information extraction
 import re
 import logging
 from datetime import datetime
-from config import REGEX_PATTERNS, ACTION_VERBS, TECHNICAL_CONCEPTS, CURRENT_YEAR
+from config import REGEX_PATTERNS, ACTION_VERBS, TECHNICAL_CONCEPTS, CURRENT_YEAR, ATS_KEYWORDS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; logging is configured once by the app entrypoint
 logger = logging.getLogger(__name__)
 
 class ResumeParser:
@@ -67,7 +66,32 @@ class ResumeParser:
         
         logger.info(f"Extracted {len(sections)} comprehensive section categories")
         return sections
-    
+
+    def precompute_features(self, text):
+        """
+        Precompute shared text features consumed by the downstream analyzers
+
+        Scoring, strength/weakness analysis, and job matching each scan the
+        same resume against the same ATS keyword sets; lowercasing the text
+        and resolving the per-role keyword hits once lets all three skip
+        their own substring passes.
+
+        Args:
+            text (str): Resume text content
+
+        Returns:
+            dict: {'lower': lowercased text,
+                   'keyword_hits': {role_key: {category: [matched keywords]}}}
+        """
+        text_lower = text.lower()
+        keyword_hits = {}
+        for role_key, role_data in ATS_KEYWORDS.items():
+            keyword_hits[role_key] = {
+                category: [kw for kw in role_data.get(category, []) if kw.lower() in text_lower]
+                for category in ('core_skills', 'frameworks', 'methodologies', 'platforms')
+            }
+        return {'lower': text_lower, 'keyword_hits': keyword_hits}
+
     def _extract_contact_info(self, text):
         """Extract and validate contact information"""
         contact_info = {}
@@ -6,8 +6,7 @@ Calculates comprehensive scores without social media dependencies
 import logging
 from config import SCORING_CONFIG, ATS_KEYWORDS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; logging is configured once by the app entrypoint
 logger = logging.getLogger(__name__)
 
 class ATSScoringEngine:
@@ -17,15 +16,17 @@ class ATSScoringEngine:
         self.scoring_config = SCORING_CONFIG
         self.ats_keywords = ATS_KEYWORDS
     
-    def calculate_comprehensive_ats_score(self, text, sections, target_role=None):
+    def calculate_comprehensive_ats_score(self, text, sections, target_role=None, features=None):
         """
         Calculate comprehensive ATS score with detailed breakdown
-        
+
         Args:
             text (str): Resume text content
             sections (dict): Parsed resume sections
             target_role (str): Target job role for customized scoring
-            
+            features (dict): Optional precomputed features from
+                ResumeParser.precompute_features; skips re-scanning the text
+
         Returns:
             tuple: (total_score, max_score, detailed_breakdown)
         """
@@ -39,7 +40,7 @@ class ATSScoringEngine:
         
         # Analyze each scoring category
         self._score_contact_information(sections, score_breakdown['contact_info'])
-        self._score_technical_skills(text, sections, target_role, score_breakdown['technical_skills'])
+        self._score_technical_skills(text, sections, target_role, score_breakdown['technical_skills'], features)
         self._score_experience_quality(sections, score_breakdown['experience_quality'])
         self._score_quantified_achievements(sections, score_breakdown['quantified_achievements'])
         self._score_content_optimization(text, sections, score_breakdown['content_optimization'])
@@ -85,10 +86,10 @@ class ATSScoringEngine:
         if sections.get('email') and sections.get('phone'):
             contact_score['details'].append("🎯 Complete contact information enables easy recruiter outreach")
     
-    def _score_technical_skills(self, text, sections, target_role, skills_score):
+    def _score_technical_skills(self, text, sections, target_role, skills_score, features=None):
         """Score technical skills relevance and depth"""
         skills_text = sections.get('skills_text', '').lower()
-        text_lower = text.lower()
+        text_lower = features['lower'] if features else text.lower()
         individual_skills = sections.get('individual_skills', [])
         
         # Base technical skills assessment
@@ -115,9 +116,11 @@ class ATSScoringEngine:
         
         # Role-specific skills analysis
         role_bonus = 0
-        if target_role and target_role.lower().replace(' ', '_') in self.ats_keywords:
-            role_data = self.ats_keywords[target_role.lower().replace(' ', '_')]
-            role_bonus = self._calculate_role_specific_score(text_lower, role_data, skills_score, target_role)
+        role_key = target_role.lower().replace(' ', '_') if target_role else None
+        if role_key and role_key in self.ats_keywords:
+            role_data = self.ats_keywords[role_key]
+            role_hits = features['keyword_hits'].get(role_key) if features else None
+            role_bonus = self._calculate_role_specific_score(text_lower, role_data, skills_score, target_role, role_hits)
         else:
             # General technical skills assessment
             role_bonus = self._calculate_general_tech_score(text_lower, skills_score)
@@ -274,42 +277,52 @@ class ATSScoringEngine:
         # Cap at maximum score
         content_score['score'] = min(content_score['score'], 10)
     
-    def _calculate_role_specific_score(self, text_lower, role_data, skills_score, target_role):
+    def _calculate_role_specific_score(self, text_lower, role_data, skills_score, target_role, role_hits=None):
         """Calculate role-specific technical skills score"""
         role_score = 0
-        
-        # Core skills matching
+
+        # Core skills matching (precomputed hits avoid re-scanning the text)
         core_skills = role_data.get('core_skills', [])
-        matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
+        if role_hits is not None:
+            matched_core = role_hits['core_skills']
+        else:
+            matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
         core_score = min(15, len(matched_core) * 2)
         role_score += core_score
-        
+
         if matched_core:
             skills_score['details'].append(f"✅ {target_role} core skills: {', '.join(matched_core[:6])}")
-        
+
         # Framework matching
         frameworks = role_data.get('frameworks', [])
-        matched_frameworks = [fw for fw in frameworks if fw.lower() in text_lower]
+        if role_hits is not None:
+            matched_frameworks = role_hits['frameworks']
+        else:
+            matched_frameworks = [fw for fw in frameworks if fw.lower() in text_lower]
         framework_score = min(8, len(matched_frameworks) * 1.5)
         role_score += framework_score
-        
+
         if matched_frameworks:
             skills_score['details'].append(f"✅ Relevant frameworks: {', '.join(matched_frameworks[:4])}")
-        
+
         # Methodology matching
         methodologies = role_data.get('methodologies', [])
-        matched_methodologies = [method for method in methodologies if method.lower() in text_lower]
+        if role_hits is not None:
+            matched_methodologies = role_hits['methodologies']
+        else:
+            matched_methodologies = [method for method in methodologies if method.lower() in text_lower]
         method_score = min(5, len(matched_methodologies) * 1)
         role_score += method_score
-        
+
         if matched_methodologies:
             skills_score['details'].append(f"✅ Industry methodologies: {', '.join(matched_methodologies[:3])}")
-        
+
         # Identify missing critical skills
-        missing_core = [skill for skill in core_skills[:6] if skill.lower() not in text_lower]
+        matched_core_set = set(matched_core)
+        missing_core = [skill for skill in core_skills[:6] if skill not in matched_core_set]
         if missing_core:
             skills_score['details'].append(f"❌ Missing {target_role} skills: {', '.join(missing_core[:4])}")
-        
+
         return role_score
     
     def _calculate_general_tech_score(self, text_lower, skills_score):
@@ -6,8 +6,7 @@ Provides detailed analysis without social media dependencies
 import logging
 from config import ATS_KEYWORDS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; logging is configured once by the app entrypoint
 logger = logging.getLogger(__name__)
 
 class StrengthWeaknessAnalyzer:
@@ -16,15 +15,17 @@ class StrengthWeaknessAnalyzer:
     def __init__(self):
         self.ats_keywords = ATS_KEYWORDS
     
-    def analyze_comprehensive_strengths_weaknesses(self, text, sections, target_role=None):
+    def analyze_comprehensive_strengths_weaknesses(self, text, sections, target_role=None, features=None):
         """
         Provide detailed strength and weakness analysis with specific explanations
-        
+
         Args:
             text (str): Resume text content
             sections (dict): Parsed resume sections
             target_role (str): Target job role for analysis
-            
+            features (dict): Optional precomputed features from
+                ResumeParser.precompute_features; skips re-scanning the text
+
         Returns:
             tuple: (detailed_strengths, detailed_weaknesses)
         """
@@ -33,14 +34,14 @@ class StrengthWeaknessAnalyzer:
         
         # Analyze strengths with comprehensive explanations
         strengths_detailed.extend(self._analyze_experience_strengths(sections))
-        strengths_detailed.extend(self._analyze_technical_strengths(text, sections, target_role))
+        strengths_detailed.extend(self._analyze_technical_strengths(text, sections, target_role, features))
         strengths_detailed.extend(self._analyze_achievement_strengths(sections))
         strengths_detailed.extend(self._analyze_content_quality_strengths(sections))
         strengths_detailed.extend(self._analyze_professional_presentation_strengths(sections))
         
         # Analyze weaknesses with detailed improvement guidance
         weaknesses_detailed.extend(self._analyze_contact_weaknesses(sections))
-        weaknesses_detailed.extend(self._analyze_technical_weaknesses(text, sections, target_role))
+        weaknesses_detailed.extend(self._analyze_technical_weaknesses(text, sections, target_role, features))
         weaknesses_detailed.extend(self._analyze_experience_weaknesses(sections))
         weaknesses_detailed.extend(self._analyze_achievement_weaknesses(sections))
         weaknesses_detailed.extend(self._analyze_content_structure_weaknesses(sections))
@@ -122,10 +123,10 @@ class StrengthWeaknessAnalyzer:
         
         return strengths
     
-    def _analyze_technical_strengths(self, text, sections, target_role):
+    def _analyze_technical_strengths(self, text, sections, target_role, features=None):
         """Analyze technical skills and competency strengths"""
         strengths = []
-        text_lower = text.lower()
+        text_lower = features['lower'] if features else text.lower()
         
         # Comprehensive technical skills
         skills_count = sections.get('skills_count', 0)
@@ -166,11 +167,15 @@ class StrengthWeaknessAnalyzer:
             })
         
         # Role-specific technical alignment
-        if target_role and target_role.lower().replace(' ', '_') in self.ats_keywords:
-            role_data = self.ats_keywords[target_role.lower().replace(' ', '_')]
+        role_key = target_role.lower().replace(' ', '_') if target_role else None
+        if role_key and role_key in self.ats_keywords:
+            role_data = self.ats_keywords[role_key]
             core_skills = role_data.get('core_skills', [])
-            matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
-            
+            if features:
+                matched_core = features['keyword_hits'][role_key]['core_skills']
+            else:
+                matched_core = [skill for skill in core_skills if skill.lower() in text_lower]
+
             if len(matched_core) >= len(core_skills) * 0.7:  # 70% or more core skills matched
                 strengths.append({
                     'strength': f'Strong {target_role} Technical Alignment',
@@ -314,10 +319,10 @@ class StrengthWeaknessAnalyzer:
         
         return weaknesses
     
-    def _analyze_technical_weaknesses(self, text, sections, target_role):
+    def _analyze_technical_weaknesses(self, text, sections, target_role, features=None):
         """Analyze technical skills and competency weaknesses"""
         weaknesses = []
-        text_lower = text.lower()
+        text_lower = features['lower'] if features else text.lower()
         
         # Insufficient technical skills
         skills_count = sections.get('skills_count', 0)
@@ -345,10 +350,15 @@ class StrengthWeaknessAnalyzer:
             })
         
         # Role-specific skill gaps
-        if target_role and target_role.lower().replace(' ', '_') in self.ats_keywords:
-            role_data = self.ats_keywords[target_role.lower().replace(' ', '_')]
+        role_key = target_role.lower().replace(' ', '_') if target_role else None
+        if role_key and role_key in self.ats_keywords:
+            role_data = self.ats_keywords[role_key]
             core_skills = role_data.get('core_skills', [])
-            missing_core = [skill for skill in core_skills[:6] if skill.lower() not in text_lower]
+            if features:
+                matched_core_set = set(features['keyword_hits'][role_key]['core_skills'])
+                missing_core = [skill for skill in core_skills[:6] if skill not in matched_core_set]
+            else:
+                missing_core = [skill for skill in core_skills[:6] if skill.lower() not in text_lower]
             
             if len(missing_core) >= 3:
                 weaknesses.append({
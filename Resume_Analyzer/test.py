@@ -4,29 +4,164 @@ Integrates all modules for comprehensive resume analysis
 """
 
 import streamlit as st
-import sys
-import os
+import hashlib
+from collections import defaultdict
+import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-# Add the current directory to Python path for imports
-sys.path.append(os.path.dirname(__file__))
+# Configure logging once at the app entrypoint; library modules only create
+# loggers and inherit this configuration
+logging.basicConfig(level=logging.INFO)
 
-# Import custom modules
+
+# Only the lightweight config is imported eagerly; the analyzer modules are
+# imported lazily inside the cache_resource factories below so reruns and
+# cold starts don't pay for paths that aren't used yet
 try:
-    from pdf_extractor import PDFExtractor
-    from resume_parser import ResumeParser
-    from scoring_engine import ATSScoringEngine
-    from strength_weakness_analyzer import StrengthWeaknessAnalyzer
-    from job_matcher import JobRoleMatcher
-    from ai_analyzer import AIResumeAnalyzer
     from config import ATS_KEYWORDS, INDUSTRY_INSIGHTS
 except ImportError as e:
     st.error(f"Import error: {e}")
     st.error("Please ensure all module files are in the same directory as this test.py file")
     st.stop()
 
+# Singleton analyzer factories: st.cache_resource instantiates each class once
+# per process instead of on every script rerun
+
+@st.cache_resource
+def get_pdf_extractor():
+    from pdf_extractor import PDFExtractor
+    return PDFExtractor()
+
+@st.cache_resource
+def get_resume_parser():
+    from resume_parser import ResumeParser
+    return ResumeParser()
+
+@st.cache_resource
+def get_scoring_engine():
+    from scoring_engine import ATSScoringEngine
+    return ATSScoringEngine()
+
+@st.cache_resource
+def get_strength_weakness_analyzer():
+    from strength_weakness_analyzer import StrengthWeaknessAnalyzer
+    return StrengthWeaknessAnalyzer()
+
+@st.cache_resource
+def get_job_matcher():
+    from job_matcher import JobRoleMatcher
+    return JobRoleMatcher()
+
+def get_ai_analyzer():
+    """Per-session AI analyzer instance
+
+    Deliberately not cache_resource: the analyzer holds the user's mutable
+    API key (and in-process semantic caches), so a process-wide singleton
+    would let concurrent sessions clobber each other's keys and see each
+    other's analyses. Session state scopes it to one user.
+    """
+    if 'ai_analyzer' not in st.session_state:
+        from ai_analyzer import AIResumeAnalyzer
+        st.session_state['ai_analyzer'] = AIResumeAnalyzer()
+    return st.session_state['ai_analyzer']
+
+@st.cache_data(show_spinner=False)
+def _role_display_map():
+    """Map display names ("Data Scientist") to ATS keyword keys, built once"""
+    return {key.replace('_', ' ').title(): key for key in ATS_KEYWORDS.keys()}
+
+def _resume_hash(resume_text):
+    """Cheap fingerprint of the resume text used as a cache key"""
+    return hashlib.blake2b(resume_text.encode('utf-8'), digest_size=16).hexdigest()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _validate_key(key_hash, _analyzer):
+    """Memoized API-key validation keyed by key fingerprint
+
+    The sidebar text input reruns the script on every keystroke; caching by
+    fingerprint means each candidate key hits the network exactly once.
+    """
+    return _analyzer.validate_api_connection()
+
+# Cached analysis wrappers: Streamlit reruns the whole script on every widget
+# interaction, so each expensive analysis is keyed by the resume fingerprint
+# and target role. Underscore-prefixed args are excluded from the cache key.
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_sections(text_hash, _parser, _resume_text):
+    """Memoized resume section parsing"""
+    return _parser.extract_comprehensive_sections(_resume_text)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_score(text_hash, target_role, _engine, _resume_text, _sections, _features=None):
+    """Memoized ATS score calculation"""
+    return _engine.calculate_comprehensive_ats_score(_resume_text, _sections, target_role, _features)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_strengths_weaknesses(text_hash, target_role, _analyzer, _resume_text, _sections, _features=None):
+    """Memoized strengths/weaknesses analysis shared by three tabs"""
+    return _analyzer.analyze_comprehensive_strengths_weaknesses(_resume_text, _sections, target_role, _features)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_jobmatch(text_hash, target_role, _matcher, _resume_text, _sections, _features=None):
+    """Memoized job market compatibility analysis"""
+    return _matcher.get_comprehensive_job_analysis(_resume_text, _sections, target_role, _features)
+
+# Static UI copy built once at import so reruns don't reallocate the strings
+
+_PREVIEW = [
+    ("📋 Overview", """
+                **Comprehensive Executive Summary:**
+                - Professional profile assessment
+                - Contact information completeness
+                - Technical skill evaluation
+                - Experience quality analysis
+                """),
+    ("📊 Scoring", """
+                **Detailed ATS Scoring:**
+                - Contact Information (15 points)
+                - Technical Skills (30 points)
+                - Experience Quality (25 points)
+                - Quantified Achievements (20 points)
+                - Content Optimization (10 points)
+                """),
+    ("💪 Insights", """
+                **Strengths & Weaknesses Analysis:**
+                - Detailed strength explanations
+                - Specific weakness identification
+                - Competitive advantage assessment
+                - Professional positioning insights
+                """),
+    ("🎯 Recommendations", """
+                **Actionable Recommendations:**
+                - Immediate critical fixes
+                - Content enhancement strategies
+                - Keyword optimization
+                - Career development roadmap
+                """),
+]
+
+_ANALYSIS_COMPONENTS = [
+    "✅ PDF Text Extraction",
+    "✅ Content Parsing & Analysis",
+    "✅ ATS Scoring (No Social Media)",
+    "✅ Strengths & Weaknesses",
+    "✅ Job Market Compatibility",
+    "✅ Improvement Recommendations",
+]
+
+_IMPROVEMENT_TIMELINE = [
+    ("Week 1-2", "Fix critical contact and formatting issues", "🔴"),
+    ("Month 1-2", "Enhance content quality and technical depth", "🟡"),
+    ("Month 2-3", "Build project portfolio and quantified achievements", "🟠"),
+    ("Month 3-6", "Advanced skill development and specialization", "🟢")
+]
+
 def main():
     """Main application function"""
+    initialize_session_state()
+
     st.set_page_config(
         page_title="Enhanced Resume Analyzer", 
         layout="wide", 
@@ -38,13 +173,13 @@ def main():
     st.markdown("### Comprehensive ATS-optimized resume analysis with detailed insights")
     st.markdown("---")
     
-    # Initialize components
-    pdf_extractor = PDFExtractor()
-    resume_parser = ResumeParser()
-    scoring_engine = ATSScoringEngine()
-    strength_weakness_analyzer = StrengthWeaknessAnalyzer()
-    job_matcher = JobRoleMatcher()
-    ai_analyzer = AIResumeAnalyzer()
+    # Initialize components (process-wide singletons, built once)
+    pdf_extractor = get_pdf_extractor()
+    resume_parser = get_resume_parser()
+    scoring_engine = get_scoring_engine()
+    strength_weakness_analyzer = get_strength_weakness_analyzer()
+    job_matcher = get_job_matcher()
+    ai_analyzer = get_ai_analyzer()
     
     # Sidebar Configuration
     with st.sidebar:
@@ -59,7 +194,10 @@ def main():
         
         if api_key:
             ai_analyzer.set_api_key(api_key)
-            is_valid, message = ai_analyzer.validate_api_connection()
+            is_valid, message = _validate_key(
+                hashlib.blake2b(api_key.encode('utf-8'), digest_size=16).hexdigest(),
+                ai_analyzer
+            )
             if is_valid:
                 st.success("✅ API key validated")
             else:
@@ -80,36 +218,24 @@ def main():
         
         target_role = None
         if analysis_mode in ["Target Specific Role", "Career Exploration"]:
-            available_roles = list(ATS_KEYWORDS.keys())
-            role_display_names = [role.replace('_', ' ').title() for role in available_roles]
-            
+            display_to_key = _role_display_map()
+
             selected_display = st.selectbox(
                 "Select Target Role:",
-                ["Custom Role"] + role_display_names
+                ["Custom Role"] + list(display_to_key.keys())
             )
-            
+
             if selected_display == "Custom Role":
                 target_role = st.text_input("Enter specific role:")
             else:
-                # Convert back to internal format
-                target_role = selected_display.lower().replace(' ', '_')
-                # Find the actual key
-                for key in available_roles:
-                    if key.replace('_', ' ').title() == selected_display:
-                        target_role = key.replace('_', ' ').title()
-                        break
+                # Display name is the canonical form; the analyzers normalize
+                # it back to the internal key themselves
+                target_role = selected_display
         
         # Display analysis scope
         st.markdown("---")
         st.subheader("🔍 Analysis Scope")
-        analysis_components = [
-            "✅ PDF Text Extraction",
-            "✅ Content Parsing & Analysis", 
-            "✅ ATS Scoring (No Social Media)",
-            "✅ Strengths & Weaknesses",
-            "✅ Job Market Compatibility",
-            "✅ Improvement Recommendations"
-        ]
+        analysis_components = list(_ANALYSIS_COMPONENTS)
         
         if api_key:
             analysis_components.append("✅ AI-Powered Deep Insights")
@@ -146,6 +272,11 @@ def main():
         )
         
         if analyze_button and uploaded_file:
+            # Enforce the advertised 10 MB limit before any parsing work
+            if getattr(uploaded_file, 'size', 0) > 10 * 1024 * 1024:
+                st.error("File exceeds 10 MB limit")
+                return
+
             with st.spinner("🔄 Processing your resume..."):
                 try:
                     # Step 1: Extract text from PDF
@@ -156,38 +287,59 @@ def main():
                         st.error("Failed to extract text from PDF. Please ensure the PDF contains readable text.")
                         return
                     
-                    # Step 2: Validate resume content
+                    # Step 2: Validate resume content; invalid content aborts
+                    # before any section parsing is paid for
                     is_valid, validation_message = pdf_extractor.validate_resume_content(resume_text)
                     if not is_valid:
                         st.warning(f"Content validation: {validation_message}")
-                    else:
-                        st.success(validation_message)
+                        return
+                    st.success(validation_message)
                     
-                    # Step 3: Parse resume sections
+                    # Step 3: Parse resume sections (cached per resume content)
                     st.info("Step 2: Analyzing resume content...")
-                    sections = resume_parser.extract_comprehensive_sections(resume_text)
+                    sections = _cached_sections(_resume_hash(resume_text), resume_parser, resume_text)
+
+                    # Precompute features shared by scoring, strengths, and
+                    # job matching so each doesn't re-scan the same text
+                    features = resume_parser.precompute_features(resume_text)
                     
                     # Store results in session state
                     st.session_state.update({
                         'resume_text': resume_text,
                         'sections': sections,
+                        'features': features,
                         'target_role': target_role,
                         'analysis_mode': analysis_mode,
+                        'ai_cost_estimate': ai_analyzer.get_analysis_cost_estimate(resume_text, target_role),
                         'analysis_complete': True
                     })
                     
                     # Step 4: Get AI analysis if available
                     if api_key:
                         st.info("Step 3: Generating AI insights...")
-                        try:
-                            comprehensive_ai = ai_analyzer.get_comprehensive_ai_analysis(resume_text, target_role)
-                            st.session_state['ai_comprehensive'] = comprehensive_ai
-                            
+                        # The analyses are independent network round-trips:
+                        # run the targeted analysis in the background while the
+                        # comprehensive one streams tokens into the UI as they
+                        # arrive, so perceived latency is time-to-first-token
+                        with ThreadPoolExecutor(max_workers=2) as executor:
+                            targeted_future = None
                             if target_role:
-                                targeted_ai = ai_analyzer.get_targeted_role_analysis(resume_text, target_role)
-                                st.session_state['ai_targeted'] = targeted_ai
-                        except Exception as e:
-                            st.warning(f"AI analysis encountered an issue: {str(e)}")
+                                targeted_future = executor.submit(
+                                    ai_analyzer.get_targeted_role_analysis, resume_text, target_role
+                                )
+
+                            try:
+                                st.session_state['ai_comprehensive'] = st.write_stream(
+                                    ai_analyzer.stream_comprehensive_ai_analysis(resume_text, target_role)
+                                )
+                            except Exception as e:
+                                st.warning(f"AI analysis encountered an issue: {str(e)}")
+
+                            if targeted_future is not None:
+                                try:
+                                    st.session_state['ai_targeted'] = targeted_future.result()
+                                except Exception as e:
+                                    st.warning(f"Role-specific AI analysis encountered an issue: {str(e)}")
                     
                     st.success("✅ Analysis completed successfully!")
                     
@@ -201,12 +353,15 @@ def main():
     
     # Results Panel
     with col2:
-        if st.session_state.get('analysis_complete'):
+        # Snapshot session state once; the proxy's lookups aren't free and
+        # this runs on every rerun
+        ss = st.session_state
+        if ss.get('analysis_complete'):
             display_analysis_results(
-                st.session_state['resume_text'],
-                st.session_state['sections'], 
-                st.session_state.get('target_role'),
-                st.session_state.get('analysis_mode'),
+                ss['resume_text'],
+                ss['sections'],
+                ss.get('target_role'),
+                ss.get('analysis_mode'),
                 scoring_engine,
                 strength_weakness_analyzer,
                 job_matcher,
@@ -217,57 +372,26 @@ def main():
             st.header("📊 Analysis Results")
             st.info("Upload a resume and click 'Start Analysis' to see comprehensive results here.")
             
-            # Show sample analysis preview
+            # Show sample analysis preview (tab titles and bodies are
+            # module-level constants)
             st.markdown("### What You'll Get:")
-            
-            preview_tabs = st.tabs(["📋 Overview", "📊 Scoring", "💪 Insights", "🎯 Recommendations"])
-            
-            with preview_tabs[0]:
-                st.markdown("""
-                **Comprehensive Executive Summary:**
-                - Professional profile assessment
-                - Contact information completeness
-                - Technical skill evaluation
-                - Experience quality analysis
-                """)
-            
-            with preview_tabs[1]:
-                st.markdown("""
-                **Detailed ATS Scoring:**
-                - Contact Information (15 points)
-                - Technical Skills (30 points)
-                - Experience Quality (25 points)
-                - Quantified Achievements (20 points)
-                - Content Optimization (10 points)
-                """)
-            
-            with preview_tabs[2]:
-                st.markdown("""
-                **Strengths & Weaknesses Analysis:**
-                - Detailed strength explanations
-                - Specific weakness identification
-                - Competitive advantage assessment
-                - Professional positioning insights
-                """)
-            
-            with preview_tabs[3]:
-                st.markdown("""
-                **Actionable Recommendations:**
-                - Immediate critical fixes
-                - Content enhancement strategies
-                - Keyword optimization
-                - Career development roadmap
-                """)
+
+            preview_tabs = st.tabs([title for title, _ in _PREVIEW])
+            for tab, (_, body) in zip(preview_tabs, _PREVIEW):
+                tab.markdown(body)
 
 def display_analysis_results(resume_text, sections, target_role, analysis_mode, scoring_engine, 
                            strength_weakness_analyzer, job_matcher, ai_analyzer, api_key):
     """Display comprehensive analysis results"""
     
     st.header("📊 Comprehensive Analysis Results")
-    
-    # Calculate scores
-    total_score, max_score, score_breakdown = scoring_engine.calculate_comprehensive_ats_score(
-        resume_text, sections, target_role
+
+    features = st.session_state.get('features')
+
+    # Calculate scores (cached per resume/role so tab clicks don't re-score)
+    total_score, max_score, score_breakdown = _cached_score(
+        _resume_hash(resume_text), target_role, scoring_engine, resume_text, sections,
+        features
     )
     
     # Display score overview
@@ -407,17 +531,27 @@ def display_detailed_scoring(score_breakdown):
         # Progress bar
         st.progress(percentage / 100)
         
-        # Detailed feedback
+        # Detailed feedback: group same-severity details into a single
+        # element instead of one Streamlit call (and frontend message) per line
         if data.get('details'):
+            buckets = {'✅': [], '❌': [], '⚠️': [], '': []}
             for detail in data['details']:
                 if detail.startswith('✅'):
-                    st.success(detail)
+                    buckets['✅'].append(detail)
                 elif detail.startswith('❌'):
-                    st.error(detail)
+                    buckets['❌'].append(detail)
                 elif detail.startswith('⚠️'):
-                    st.warning(detail)
+                    buckets['⚠️'].append(detail)
                 else:
-                    st.info(detail)
+                    buckets[''].append(detail)
+            if buckets['✅']:
+                st.success("\n\n".join(buckets['✅']))
+            if buckets['❌']:
+                st.error("\n\n".join(buckets['❌']))
+            if buckets['⚠️']:
+                st.warning("\n\n".join(buckets['⚠️']))
+            if buckets['']:
+                st.info("\n\n".join(buckets['']))
         
         st.markdown("---")
 
@@ -425,8 +559,9 @@ def display_strengths_analysis(resume_text, sections, target_role, analyzer):
     """Display detailed strengths analysis"""
     st.subheader("💪 Comprehensive Strengths Analysis")
     
-    strengths_detailed, _ = analyzer.analyze_comprehensive_strengths_weaknesses(
-        resume_text, sections, target_role
+    strengths_detailed, _ = _cached_strengths_weaknesses(
+        _resume_hash(resume_text), target_role, analyzer, resume_text, sections,
+        st.session_state.get('features')
     )
     
     if strengths_detailed:
@@ -444,10 +579,11 @@ def display_weaknesses_analysis(resume_text, sections, target_role, analyzer):
     """Display detailed weaknesses analysis"""
     st.subheader("⚠️ Critical Weaknesses Analysis")
     
-    _, weaknesses_detailed = analyzer.analyze_comprehensive_strengths_weaknesses(
-        resume_text, sections, target_role
+    _, weaknesses_detailed = _cached_strengths_weaknesses(
+        _resume_hash(resume_text), target_role, analyzer, resume_text, sections,
+        st.session_state.get('features')
     )
-    
+
     if weaknesses_detailed:
         for i, weakness in enumerate(weaknesses_detailed, 1):
             priority = weakness.get('fix_priority', 'MEDIUM').split(' - ')[0]
@@ -469,59 +605,58 @@ def display_improvement_plan(resume_text, sections, target_role, analyzer):
     st.subheader("🎯 Comprehensive Improvement Action Plan")
     
     # Get weaknesses for improvement context
-    _, weaknesses_detailed = analyzer.analyze_comprehensive_strengths_weaknesses(
-        resume_text, sections, target_role
+    _, weaknesses_detailed = _cached_strengths_weaknesses(
+        _resume_hash(resume_text), target_role, analyzer, resume_text, sections,
+        st.session_state.get('features')
     )
     
-    # Group recommendations by priority
-    critical_fixes = [w for w in weaknesses_detailed if w.get('fix_priority', '').startswith('CRITICAL')]
-    high_priority = [w for w in weaknesses_detailed if w.get('fix_priority', '').startswith('HIGH')]
-    medium_priority = [w for w in weaknesses_detailed if w.get('fix_priority', '').startswith('MEDIUM')]
-    
+    # Group recommendations by priority in one pass instead of three
+    # filtered comprehensions over the same list
+    priority_buckets = defaultdict(list)
+    for weakness in weaknesses_detailed:
+        priority_buckets[weakness.get('fix_priority', 'MEDIUM').split(' - ')[0]].append(weakness)
+    critical_fixes = priority_buckets['CRITICAL']
+    high_priority = priority_buckets['HIGH']
+    medium_priority = priority_buckets['MEDIUM']
+    
+    # Each priority block is assembled into one markdown string so the whole
+    # section renders as a single element rather than four calls per item
+    def _priority_block(items):
+        return "\n\n---\n\n".join(
+            f"**{item['weakness']}**\n\n"
+            f"**Action:** {item['specific_fix']}\n\n"
+            f"**Timeline:** {item['timeline']}"
+            for item in items
+        )
+
     # Critical Fixes Section
     if critical_fixes:
         st.markdown("### 🔴 Critical Fixes (Next 1-2 weeks)")
-        for fix in critical_fixes:
-            st.error(f"**{fix['weakness']}**")
-            st.write(f"**Action:** {fix['specific_fix']}")
-            st.write(f"**Timeline:** {fix['timeline']}")
-            st.markdown("---")
-    
+        st.error(_priority_block(critical_fixes))
+
     # High Priority Improvements
     if high_priority:
         st.markdown("### 🟡 High Priority Improvements (Next 1-2 months)")
-        for improvement in high_priority:
-            st.warning(f"**{improvement['weakness']}**")
-            st.write(f"**Action:** {improvement['specific_fix']}")
-            st.write(f"**Timeline:** {improvement['timeline']}")
-            st.markdown("---")
-    
+        st.warning(_priority_block(high_priority))
+
     # Medium Priority Enhancements
     if medium_priority:
         st.markdown("### 🟠 Medium Priority Enhancements (Next 2-6 months)")
-        for enhancement in medium_priority:
-            st.info(f"**{enhancement['weakness']}**")
-            st.write(f"**Action:** {enhancement['specific_fix']}")
-            st.write(f"**Timeline:** {enhancement['timeline']}")
-            st.markdown("---")
+        st.info(_priority_block(medium_priority))
     
     # Success Timeline
     st.markdown("### 📅 Implementation Timeline")
-    timeline_data = [
-        ("Week 1-2", "Fix critical contact and formatting issues", "🔴"),
-        ("Month 1-2", "Enhance content quality and technical depth", "🟡"),
-        ("Month 2-3", "Build project portfolio and quantified achievements", "🟠"),
-        ("Month 3-6", "Advanced skill development and specialization", "🟢")
-    ]
-    
-    for period, task, priority in timeline_data:
+    for period, task, priority in _IMPROVEMENT_TIMELINE:
         st.write(f"{priority} **{period}:** {task}")
 
 def display_job_market_analysis(resume_text, sections, target_role, job_matcher):
     """Display comprehensive job market analysis"""
     st.subheader("🔍 Job Market Compatibility Analysis")
     
-    job_analysis = job_matcher.get_comprehensive_job_analysis(resume_text, sections, target_role)
+    job_analysis = _cached_jobmatch(
+        _resume_hash(resume_text), target_role, job_matcher, resume_text, sections,
+        st.session_state.get('features')
+    )
     
     # Overall Readiness Assessment
     overall_readiness = job_analysis.get('overall_readiness', {})
@@ -599,53 +734,57 @@ def display_job_market_analysis(resume_text, sections, target_role, job_matcher)
 def display_ai_insights(ai_analyzer, target_role):
     """Display AI-powered insights"""
     st.subheader("🤖 AI-Powered Deep Analysis")
-    
+
+    # Snapshot the needed keys once instead of repeated proxy lookups
+    ss = st.session_state
+    ai_analysis = ss.get('ai_comprehensive')
+    targeted_analysis = ss.get('ai_targeted')
+    resume_text = ss.get('resume_text')
+
     # Comprehensive AI Analysis
-    if 'ai_comprehensive' in st.session_state:
+    if ai_analysis is not None:
         st.markdown("### 🧠 Comprehensive AI Assessment")
-        ai_analysis = st.session_state['ai_comprehensive']
-        
         if ai_analysis and not ai_analysis.startswith("AI analysis"):
             st.markdown(ai_analysis)
         else:
             st.warning("AI analysis not available. Please check your API key and try again.")
     
     # Role-Specific AI Analysis
-    if target_role and 'ai_targeted' in st.session_state:
+    if target_role and targeted_analysis is not None:
         st.markdown(f"### 🎯 {target_role} Role-Specific Analysis")
-        targeted_analysis = st.session_state['ai_targeted']
-        
         if targeted_analysis and not targeted_analysis.startswith("Role-specific"):
             st.markdown(targeted_analysis)
         else:
             st.warning("Role-specific AI analysis not available.")
     
-    # Cost Information
-    if hasattr(st.session_state, 'resume_text'):
-        cost_estimate = ai_analyzer.get_analysis_cost_estimate(
-            st.session_state['resume_text'], target_role
-        )
+    # Cost Information. hasattr() on the session proxy was always true, so
+    # membership is checked explicitly via the snapshot
+    if resume_text is not None:
+        # The estimate depends only on the resume and role, both fixed for
+        # the session, so compute it once and reuse across tab clicks
+        cost_estimate = ss.get('ai_cost_estimate')
+        if cost_estimate is None:
+            cost_estimate = ai_analyzer.get_analysis_cost_estimate(resume_text, target_role)
+            ss['ai_cost_estimate'] = cost_estimate
         
         with st.expander("📊 AI Analysis Usage Information"):
             st.write(f"**Estimated Tokens Used:** {cost_estimate['estimated_tokens']:,}")
             st.write(f"**Estimated Cost:** ${cost_estimate['estimated_cost_usd']}")
             st.write(f"**Analysis Types:** {', '.join(cost_estimate['analysis_types'])}")
 
+_SESSION_DEFAULTS = {
+    'analysis_complete': False,
+    'resume_text': None,
+    'sections': {},
+    'target_role': None,
+}
+
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'analysis_complete' not in st.session_state:
-        st.session_state['analysis_complete'] = False
-    if 'resume_text' not in st.session_state:
-        st.session_state['resume_text'] = None
-    if 'sections' not in st.session_state:
-        st.session_state['sections'] = {}
-    if 'target_role' not in st.session_state:
-        st.session_state['target_role'] = None
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
 if __name__ == "__main__":
-    # Initialize session state
-    initialize_session_state()
-    
     try:
         main()
     except Exception as e: